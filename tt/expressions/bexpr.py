@@ -3,6 +3,7 @@
 import re
 
 from contextlib import contextmanager
+from functools import lru_cache
 
 from tt._assertions import (
     assert_all_valid_keys,
@@ -34,6 +35,24 @@ from tt.trees import (
     UnaryOperatorExpressionTreeNode)
 
 
+_IS_SYMBOLIC = {op: not op[0].isalpha() for op in OPERATOR_MAPPING}
+"""Whether each operator string is symbolic (rather than plain English)."""
+
+_DELIMITERS = DELIMITERS | set(op[0] for op, is_symbolic in
+                               _IS_SYMBOLIC.items() if is_symbolic)
+"""Characters that terminate an operand during tokenization."""
+
+_DELIMITER_RE = re.compile(
+    '[' + ''.join(re.escape(c) for c in sorted(_DELIMITERS)) + ']')
+"""Pattern matching the next operand-terminating character."""
+
+_OPERATOR_RE = re.compile('|'.join(
+    re.escape(op) for op in sorted(OPERATOR_MAPPING, key=len, reverse=True)))
+"""Pattern matching the longest operator string at a position."""
+
+_LEFT_PAREN_RE = re.compile(r'\(')
+
+
 class BooleanExpression(object):
 
     """An interface for interacting with a Boolean expression.
@@ -770,117 +789,10 @@ class BooleanExpression(object):
         :raises GrammarError: If a malformed expression is received.
 
         """
-        operator_strs = [k for k in OPERATOR_MAPPING.keys()]
-        is_symbolic = {op: not op[0].isalpha() for op in operator_strs}
-        operator_search_list = sorted(operator_strs, key=len, reverse=True)
-        delimiters = DELIMITERS | set(k[0] for k, v in is_symbolic.items()
-                                      if v)
-        EXPECTING_OPERAND = 1
-        EXPECTING_OPERATOR = 2
-        grammar_state = EXPECTING_OPERAND
-
-        idx = 0
-        open_paren_count = 0
-        num_chars = len(self._raw_expr)
-
-        while idx < num_chars:
-            c = self._raw_expr[idx].strip()
-
-            if not c:
-                # do nothing
-                idx += 1
-            elif c == '(':
-                if grammar_state != EXPECTING_OPERAND:
-                    raise BadParenPositionError('Unexpected parenthesis',
-                                                self._raw_expr, idx)
-
-                open_paren_count += 1
-                self._tokens.append(c)
-                idx += 1
-            elif c == ')':
-                if grammar_state != EXPECTING_OPERATOR:
-                    raise BadParenPositionError('Unexpected parenthesis',
-                                                self._raw_expr, idx)
-                elif not open_paren_count:
-                    raise UnbalancedParenError('Unbalanced parenthesis',
-                                               self._raw_expr, idx)
-
-                open_paren_count -= 1
-                self._tokens.append(c)
-                idx += 1
-            else:
-                is_operator = False
-                num_chars_remaining = num_chars - idx
-
-                matching_operators = [
-                    operator for operator in operator_search_list
-                    if len(operator) <= num_chars_remaining and
-                    self._raw_expr[idx:(idx+len(operator))] == operator]
-
-                if matching_operators:
-                    match = matching_operators[0]
-                    match_length = len(match)
-                    next_c_pos = idx + match_length
-                    next_c = (None if next_c_pos >= num_chars else
-                              self._raw_expr[idx + match_length])
-
-                    if next_c is None:
-                        # trailing operator
-                        raise ExpressionOrderError(
-                            'Unexpected operator "{}"'.format(match),
-                            self._raw_expr, idx)
-
-                    if next_c in delimiters or is_symbolic[match]:
-                        if OPERATOR_MAPPING[match] == TT_NOT_OP:
-                            if grammar_state != EXPECTING_OPERAND:
-                                raise ExpressionOrderError(
-                                    'Unexpected unary operator "{}"'.format(
-                                        match), self._raw_expr, idx)
-                        else:
-                            if grammar_state != EXPECTING_OPERATOR:
-                                raise ExpressionOrderError(
-                                    'Unexpected binary operator "{}"'.format(
-                                        match), self._raw_expr, idx)
-                            grammar_state = EXPECTING_OPERAND
-
-                        is_operator = True
-                        self._tokens.append(match)
-                        idx += match_length
-
-                if not is_operator:
-                    if grammar_state != EXPECTING_OPERAND:
-                        raise ExpressionOrderError('Unexpected operand',
-                                                   self._raw_expr, idx)
-
-                    operand_end_idx = idx + 1
-                    while (operand_end_idx < num_chars and
-                           self._raw_expr[operand_end_idx] not in delimiters):
-                        operand_end_idx += 1
-
-                    operand = self._raw_expr[idx:operand_end_idx]
-                    if (operand not in CONSTANT_VALUES and
-                            not is_valid_identifier(operand)):
-                        raise InvalidIdentifierError(
-                            'Invalid operand name "{}"'.format(operand),
-                            self._raw_expr, idx)
-
-                    self._tokens.append(operand)
-                    if operand not in self._symbol_set:
-                        self._symbols.append(operand)
-                        self._symbol_set.add(operand)
-
-                    idx = operand_end_idx
-                    grammar_state = EXPECTING_OPERATOR
-
-        if open_paren_count:
-            left_paren_positions = [m.start() for m in
-                                    re.finditer(r'\(', self._raw_expr)]
-            raise UnbalancedParenError(
-                'Unbalanced left parenthesis', self._raw_expr,
-                left_paren_positions[open_paren_count-1])
-
-        if not self._tokens:
-            raise EmptyExpressionError('Empty expression is invalid')
+        tokens, symbols = _tokenize_expr_str(self._raw_expr)
+        self._tokens.extend(tokens)
+        self._symbols.extend(symbols)
+        self._symbol_set.update(symbols)
 
     def _to_postfix(self):
         """Populate the ``_postfix_tokens`` attribute."""
@@ -914,3 +826,129 @@ class BooleanExpression(object):
         self._symbol_set |= CONSTANT_VALUES
         yield
         self._symbol_set -= CONSTANT_VALUES
+
+
+@lru_cache(maxsize=4096)
+def _tokenize_expr_str(raw_expr):
+    """Tokenize a raw expression string.
+
+    Results are cached, so repeatedly building expressions from the same
+    string only pays for tokenization once.
+
+    :param raw_expr: The stripped expression string to tokenize.
+    :type raw_expr: :class:`str <python:str>`
+
+    :returns: A tuple of the expression's tokens and a tuple of its unique
+        symbols, in order of appearance.
+    :rtype: Tuple[Tuple[:class:`str <python:str>`, ...], \
+        Tuple[:class:`str <python:str>`, ...]]
+
+    :raises GrammarError: If a malformed expression is received.
+
+    """
+    tokens = []
+    symbols = []
+    symbol_set = set(CONSTANT_VALUES)
+
+    EXPECTING_OPERAND = 1
+    EXPECTING_OPERATOR = 2
+    grammar_state = EXPECTING_OPERAND
+
+    idx = 0
+    open_paren_count = 0
+    num_chars = len(raw_expr)
+
+    while idx < num_chars:
+        c = raw_expr[idx].strip()
+
+        if not c:
+            # do nothing
+            idx += 1
+        elif c == '(':
+            if grammar_state != EXPECTING_OPERAND:
+                raise BadParenPositionError('Unexpected parenthesis',
+                                            raw_expr, idx)
+
+            open_paren_count += 1
+            tokens.append(c)
+            idx += 1
+        elif c == ')':
+            if grammar_state != EXPECTING_OPERATOR:
+                raise BadParenPositionError('Unexpected parenthesis',
+                                            raw_expr, idx)
+            elif not open_paren_count:
+                raise UnbalancedParenError('Unbalanced parenthesis',
+                                           raw_expr, idx)
+
+            open_paren_count -= 1
+            tokens.append(c)
+            idx += 1
+        else:
+            is_operator = False
+            operator_match = _OPERATOR_RE.match(raw_expr, idx)
+
+            if operator_match is not None:
+                match = operator_match.group()
+                match_length = len(match)
+                next_c_pos = idx + match_length
+                next_c = (None if next_c_pos >= num_chars else
+                          raw_expr[idx + match_length])
+
+                if next_c is None:
+                    # trailing operator
+                    raise ExpressionOrderError(
+                        'Unexpected operator "{}"'.format(match),
+                        raw_expr, idx)
+
+                if next_c in _DELIMITERS or _IS_SYMBOLIC[match]:
+                    if OPERATOR_MAPPING[match] == TT_NOT_OP:
+                        if grammar_state != EXPECTING_OPERAND:
+                            raise ExpressionOrderError(
+                                'Unexpected unary operator "{}"'.format(
+                                    match), raw_expr, idx)
+                    else:
+                        if grammar_state != EXPECTING_OPERATOR:
+                            raise ExpressionOrderError(
+                                'Unexpected binary operator "{}"'.format(
+                                    match), raw_expr, idx)
+                        grammar_state = EXPECTING_OPERAND
+
+                    is_operator = True
+                    tokens.append(match)
+                    idx += match_length
+
+            if not is_operator:
+                if grammar_state != EXPECTING_OPERAND:
+                    raise ExpressionOrderError('Unexpected operand',
+                                               raw_expr, idx)
+
+                delimiter_match = _DELIMITER_RE.search(raw_expr, idx + 1)
+                operand_end_idx = (num_chars if delimiter_match is None else
+                                   delimiter_match.start())
+
+                operand = raw_expr[idx:operand_end_idx]
+                if (operand not in CONSTANT_VALUES and
+                        not is_valid_identifier(operand)):
+                    raise InvalidIdentifierError(
+                        'Invalid operand name "{}"'.format(operand),
+                        raw_expr, idx)
+
+                tokens.append(operand)
+                if operand not in symbol_set:
+                    symbols.append(operand)
+                    symbol_set.add(operand)
+
+                idx = operand_end_idx
+                grammar_state = EXPECTING_OPERATOR
+
+    if open_paren_count:
+        left_paren_positions = [m.start() for m in
+                                _LEFT_PAREN_RE.finditer(raw_expr)]
+        raise UnbalancedParenError(
+            'Unbalanced left parenthesis', raw_expr,
+            left_paren_positions[open_paren_count-1])
+
+    if not tokens:
+        raise EmptyExpressionError('Empty expression is invalid')
+
+    return tuple(tokens), tuple(symbols)
@@ -3,6 +3,7 @@
 from tt.definitions import (
     OPERATOR_MAPPING,
     TT_NOT_OP)
+from tt.expressions import BooleanExpression
 
 from ._helpers import ExpressionTestCase
 
@@ -248,3 +249,16 @@ class TestBooleanExpressionParsing(ExpressionTestCase):
                 '|    `----op1',
                 '|    `----op2',
                 '`----1')))
+
+    def test_repeated_expression_does_not_share_state(self):
+        """Test expressions parsed from the same string are independent."""
+        b1 = BooleanExpression('A and (B or 1)')
+        b2 = BooleanExpression('A and (B or 1)')
+
+        self.assertIsNot(b1.tokens, b2.tokens)
+        self.assertIsNot(b1.symbols, b2.symbols)
+
+        b1.tokens.append('C')
+        b1.symbols.append('C')
+        self.assertEqual(['A', 'and', '(', 'B', 'or', '1', ')'], b2.tokens)
+        self.assertEqual(['A', 'B'], b2.symbols)
@@ -4,16 +4,14 @@
 
 from __future__ import print_function
 
-import doctest
 import os
 import platform
 import subprocess
 import sys
-import tt
 import unittest
 
 from argparse import ArgumentParser, RawTextHelpFormatter
-from contextlib import contextmanager
+from functools import lru_cache
 
 
 HERE = os.path.dirname(os.path.abspath(__file__))
@@ -23,6 +21,11 @@ USER_GUIDE_DIR = os.path.join(DOCS_DIR, 'user_guide')
 TT_DIR = os.path.join(HERE, 'tt')
 TESTS_DIR = os.path.join(TT_DIR, 'tests')
 
+APPVEYOR_API_URL = 'https://ci.appveyor.com/api'
+APPVEYOR_PROJECT_URL = APPVEYOR_API_URL + '/projects/welchbj/tt'
+APPVEYOR_ARTIFACTS_URL_TEMPLATE = APPVEYOR_API_URL + '/buildjobs/{}/artifacts'
+APPVEYOR_ARTIFACT_URL_TEMPLATE = APPVEYOR_ARTIFACTS_URL_TEMPLATE + '/{}'
+
 
 class AppVeyorApiError(Exception):
     """An exception type for failed interactions with the AppVeyor API."""
@@ -36,21 +39,24 @@ class TestFailureError(Exception):
     """An exception type for failed tests."""
 
 
-@contextmanager
-def _cwd(new_cwd):
-    """Context manager for temporarily changing the cwd."""
-    old_cwd = os.getcwd()
-    os.chdir(new_cwd)
-    yield
-    os.chdir(old_cwd)
+@lru_cache(maxsize=1)
+def _sys_info():
+    """Get the current Python runtime, build, and OS info strings.
 
+    These are cached, as some :mod:`platform <python:platform>` lookups may
+    require spawning a subprocess.
 
-def _print_sys_info():
-    """Print a formatted notice of the current Python/system info to stdout."""
+    """
     py_runtime = ' '.join((platform.python_implementation(),
                            platform.python_version()))
     py_build_info = ', '.join(platform.python_build())
     os_info = ' '.join((platform.system(), platform.version()))
+    return py_runtime, py_build_info, os_info
+
+
+def _print_sys_info():
+    """Print a formatted notice of the current Python/system info to stdout."""
+    py_runtime, py_build_info, os_info = _sys_info()
 
     print()
     print('System info')
@@ -61,62 +67,83 @@ def _print_sys_info():
     print()
 
 
+def _fetch_job_artifact(session, job_dict):
+    """Download the artifact wheel of a single AppVeyor build job.
+
+    The wheel is streamed to disk in chunks rather than read into memory.
+
+    :returns: A tuple of the job's name, the artifact's URL, and the local
+        path to which it was written.
+
+    :raises AppVeyorApiError: If the AppVeyor API returns a non-200 status.
+
+    """
+    job_id, job_name = job_dict['jobId'], job_dict['name']
+
+    r = session.get(APPVEYOR_ARTIFACTS_URL_TEMPLATE.format(job_id))
+    if r.status_code != 200:
+        print('Non-200 status code received from AppVeyor API;',
+              'quitting now')
+        raise AppVeyorApiError
+
+    artifact_remote_path = r.json()[0]['fileName']
+    artifact_filename = artifact_remote_path.split('/')[1]
+    local_filename = os.path.join(DIST_DIR, artifact_filename)
+    artifact_url = APPVEYOR_ARTIFACT_URL_TEMPLATE.format(
+        job_id, artifact_remote_path)
+
+    with session.get(artifact_url, stream=True) as r:
+        if r.status_code != 200:
+            print('Non-200 status code received from AppVeyor API;',
+                  'quitting now')
+            raise AppVeyorApiError
+
+        with open(local_filename, 'wb') as f:
+            for chunk in r.iter_content(chunk_size=1 << 16):
+                f.write(chunk)
+
+    return job_name, artifact_url, local_filename
+
+
 def pull_latest_win_wheels():
     """Download the latest artifact Windows wheels from AppVeyor."""
     import requests
 
+    from concurrent.futures import as_completed, ThreadPoolExecutor
+
     token = os.environ.get('APPVEYOR_TOKEN')
     if token is None:
         print('You must set the APPVEYOR_TOKEN environment variable;',
               'quitting now', file=sys.stderr)
         raise AppVeyorApiError
 
-    headers = {
+    session = requests.Session()
+    session.headers.update({
         'Authorization': 'Bearer ' + token,
         'Content-type': 'application/json'
-    }
-    base_url = 'https://ci.appveyor.com/api'
-    project_url = base_url + '/projects/welchbj/tt'
-    artifacts_url_template = base_url + '/buildjobs/{}/artifacts'
-    single_artifact_url_template = artifacts_url_template + '/{}'
+    })
 
-    r = requests.get(project_url, headers=headers)
+    r = session.get(APPVEYOR_PROJECT_URL)
     if r.status_code != 200:
         print('Non-200 status code received from AppVeyor API; quitting now')
         raise AppVeyorApiError
 
-    for job_dict in r.json()['build']['jobs']:
-        job_id, job_name = job_dict['jobId'], job_dict['name']
-        print('Processing job "', job_name, '"', sep='')
-
-        r = requests.get(artifacts_url_template.format(job_id),
-                         headers=headers)
-        if r.status_code != 200:
-            print('Non-200 status code received from AppVeyor API;',
-                  'quitting now')
-            raise AppVeyorApiError
-
-        artifact_remote_path = r.json()[0]['fileName']
-        artifact_filename = artifact_remote_path.split('/')[1]
-        local_filename = os.path.join(DIST_DIR, artifact_filename)
-        artifact_url = single_artifact_url_template.format(
-            job_id, artifact_remote_path)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(_fetch_job_artifact, session, job_dict)
+                   for job_dict in r.json()['build']['jobs']]
 
-        print('Downloading', artifact_url, 'into', local_filename)
-        r = requests.get(artifact_url, headers=headers)
-        with open(local_filename, 'wb') as f:
-            f.write(r.content)
-
-        print('Done')
-        print()
+        for future in as_completed(futures):
+            job_name, artifact_url, local_filename = future.result()
+            print(f'Processing job "{job_name}"\n'
+                  f'Downloaded {artifact_url} into {local_filename}\n'
+                  'Done\n')
 
     print('All done!')
 
 
 def build_docs():
     """Build the documentation from source into HTML."""
-    with _cwd(DOCS_DIR):
-        exit_code = subprocess.call('make html', shell=True)
+    exit_code = subprocess.call('make html', shell=True, cwd=DOCS_DIR)
 
     if exit_code:
         print('Something went wrong building the docs', file=sys.stderr)
@@ -141,6 +168,9 @@ def serve_docs():
 
 def test():
     """Run tt tests."""
+    import doctest
+    import tt
+
     _print_sys_info()
 
     suite = unittest.defaultTestLoader.discover(
@@ -177,19 +207,37 @@ def test():
         optionflags=doctest.IGNORE_EXCEPTION_DETAIL
     )
 
+    # share a single parser/finder across all doctests, rather than letting
+    # DocTestSuite/DocFileSuite construct new ones for each module and file
+    doctest_parser = doctest.DocTestParser()
+    doctest_finder = doctest.DocTestFinder(parser=doctest_parser)
+
     for module in doctest_modules:
-        suite.addTests(
-            doctest.DocTestSuite(
-                module,
-                **common_doctest_kwargs))
+        for module_doctest in sorted(doctest_finder.find(module)):
+            if module_doctest.examples:
+                suite.addTest(
+                    doctest.DocTestCase(
+                        module_doctest,
+                        **common_doctest_kwargs))
 
     for file in doctest_files:
-        suite.addTests(
-            doctest.DocFileSuite(
+        suite.addTest(
+            doctest.DocFileTest(
                 file,
                 module_relative=False,
+                parser=doctest_parser,
                 **common_doctest_kwargs))
 
+    if sys.platform != 'win32':
+        # concurrencytest forks a worker process per CPU, which relies on
+        # os.fork; fall back to running serially if it is unavailable
+        try:
+            from concurrencytest import ConcurrentTestSuite, fork_for_tests
+            suite = ConcurrentTestSuite(
+                suite, fork_for_tests(os.cpu_count() or 1))
+        except ImportError:
+            pass
+
     runner = unittest.TextTestRunner()
     result = runner.run(suite)
     if not result.wasSuccessful():
@@ -204,6 +252,22 @@ TASKS = {
 }
 
 
+TASK_CHOICES = tuple(sorted(TASKS))
+
+_PARSER = ArgumentParser(
+    prog='ttasks.py',
+    description='Helper script for running tt project tasks (ttasks)',
+    formatter_class=RawTextHelpFormatter)
+
+_PARSER.add_argument(
+    'task',
+    action='store',
+    metavar='TASK',
+    type=str,
+    choices=TASK_CHOICES,
+    help='the ttask to run')
+
+
 def get_parsed_args(args=None):
     """Get the parsed command line arguments.
 
@@ -216,23 +280,10 @@ def get_parsed_args(args=None):
     :rtype: :class:`argparse.Namespace <python:argparse.Namespace>`
 
     """
-    parser = ArgumentParser(
-        prog='ttasks.py',
-        description='Helper script for running tt project tasks (ttasks)',
-        formatter_class=RawTextHelpFormatter)
-
-    parser.add_argument(
-        'task',
-        action='store',
-        metavar='TASK',
-        type=str,
-        choices=sorted(TASKS.keys()),
-        help='the ttask to run')
-
     if args is None:
         args = sys.argv[1:]
 
-    return parser.parse_args(args)
+    return _PARSER.parse_args(args)
 
 
 def main(args=None):
@@ -246,7 +297,7 @@ def main(args=None):
 
     """
     try:
-        opts = get_parsed_args()
+        opts = get_parsed_args(args)
         task = TASKS[opts.task]
         task()
         return 0